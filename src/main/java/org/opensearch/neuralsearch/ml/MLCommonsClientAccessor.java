@@ -6,9 +6,7 @@
 package org.opensearch.neuralsearch.ml;
 
 import java.util.ArrayList;
-import java.util.Arrays;
 import java.util.List;
-import java.util.stream.Collectors;
 
 import lombok.NonNull;
 import lombok.RequiredArgsConstructor;
@@ -138,10 +136,18 @@ public class MLCommonsClientAccessor {
         for (final ModelTensors tensors : tensorOutputList) {
             final List<ModelTensor> tensorsList = tensors.getMlModelTensors();
             for (final ModelTensor tensor : tensorsList) {
-                vector.add(Arrays.stream(tensor.getData()).map(value -> (Float) value).collect(Collectors.toList()));
+                vector.add(buildVectorFromTensorData(tensor.getData()));
             }
         }
         return vector;
     }
 
+    private List<Float> buildVectorFromTensorData(final Number[] data) {
+        final List<Float> vector = new ArrayList<>(data.length);
+        for (final Number value : data) {
+            vector.add((Float) value);
+        }
+        return vector;
+    }
+
 }